@@ -1,16 +1,51 @@
 """Main module for data generation."""
 
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, fields
 from datetime import date
 from enum import StrEnum, auto
+from functools import lru_cache
+from itertools import chain
 from faker import Faker
+import multiprocessing
+import os
+import random
 import polars as pl
+from pydantic import PositiveInt
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
-from hr.mapping import DEPARTMENT_POSITION_MAPPING
+from hr.mapping import DEPARTMENT_POSITIONS, DEPARTMENTS
 
 
-fake = Faker()
+@lru_cache(maxsize=None)
+def get_fake() -> Faker:
+    """
+    Returns the shared Faker instance.
+    Constructing Faker registers all providers, so it is created once, on first use,
+    and reused by every generator instead of per call or at import time.
+    """
+    return Faker()
+
+
+def __getattr__(name: str):
+    """Keeps `base_data_generator.fake` available without creating Faker at import."""
+    if name == "fake":
+        return get_fake()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# Record count from which generation is spread over worker processes;
+# below it, process start-up costs more than it saves.
+PARALLEL_THRESHOLD = 50_000
+
+# Records per seeded task once generation is split (see PARALLEL_THRESHOLD); fixed, so
+# that the generated data does not depend on the number of cores.
+PARALLEL_TASK_SIZE = 5_000
+
+# Default number of records generated (and written) at once.
+DEFAULT_CHUNK_SIZE = 50_000
 
 
 class EventType(StrEnum):
@@ -25,11 +60,47 @@ class EventType(StrEnum):
 class OutputFormat(StrEnum):
     """Enumeration for output formats."""
     DICT = auto()
+    RECORDS = auto()
     CSV = auto()
     PARQUET = auto()
     JSON = auto()
 
 
+@dataclass(slots=True)
+class HRRecord:
+    """A single fake HR record, stored in slots rather than a per-row dict."""
+    first_name: str
+    last_name: str
+    email: str
+    phone_number: str
+    address: str
+    date_of_birth: str
+    department: str
+    position: str
+    hire_date: str
+    salary: int
+    event_type: str
+
+    def as_dict(self) -> dict:
+        """Returns the record as a dictionary."""
+        return {field.name: getattr(self, field.name) for field in fields(self)}
+
+
+def _years_ago(today: date, years: int) -> date:
+    """Returns the same calendar day `years` years before `today`."""
+    try:
+        return today.replace(year=today.year - years)
+    except ValueError:
+        # 29 February in a non-leap target year
+        return today.replace(year=today.year - years, day=28)
+
+
+@lru_cache(maxsize=None)
+def _isoformat(ordinal: int) -> str:
+    """Returns the ISO date of a day ordinal, cached as many records share dates."""
+    return date.fromordinal(ordinal).isoformat()
+
+
 class DataGenerator(ABC):
     """Abstract base class for data generators."""
     @abstractmethod
@@ -40,58 +111,170 @@ class DataGenerator(ABC):
 class HRDataGenerator(DataGenerator):
     """Generates fake HR-related data."""
 
-    def _generate_data_in_dict(self, count: int) -> list[dict]:
+    def _generate_data_in_columns(self, count: int) -> dict[str, list]:
+        """Generates fake HR data as a mapping of column name to values."""
+        fake = get_fake()
+        rng = fake.random
+        today = date.today()
+
+        # choosing departments randomly, then a position within each department
+        departments = rng.choices(DEPARTMENTS, k=count)
+        positions = [rng.choice(DEPARTMENT_POSITIONS[department]) for department in departments]
+
+        # dates are sampled as day ordinals and formatted afterwards
+        birth_ordinals = rng.choices(
+            range(_years_ago(today, 66).toordinal() + 1, _years_ago(today, 18).toordinal() + 1),
+            k=count,
+        )
+        hire_ordinals = rng.choices(
+            range(_years_ago(today, 10).toordinal(), today.toordinal() + 1), k=count
+        )
+
+        return {
+            "first_name": [fake.first_name() for _ in range(count)],
+            "last_name": [fake.last_name() for _ in range(count)],
+            "email": [fake.email() for _ in range(count)],
+            "phone_number": [fake.phone_number() for _ in range(count)],
+            "address": [fake.address() for _ in range(count)],
+            "date_of_birth": list(map(_isoformat, birth_ordinals)),
+            "department": departments,
+            "position": positions,
+            "hire_date": list(map(_isoformat, hire_ordinals)),
+            "salary": [thousands * 1000 for thousands in rng.choices(range(35, 121), k=count)],
+            "event_type": [EventType.HIRE.value] * count,
+        }
+
+    def _generate_column_chunks(self, count: int, chunk_size: int) -> Iterator[dict[str, list]]:
+        """Generates fake HR data as column mappings of at most chunk_size rows each."""
+        # at least one (possibly empty) chunk, so that file headers are always written
+        sizes = [min(chunk_size, count - start) for start in range(0, max(count, 1), chunk_size)]
+        if count < PARALLEL_THRESHOLD:
+            yield from map(self._generate_data_in_columns, sizes)
+            return
+
+        # every chunk is split into fixed-size tasks, each with its own seed drawn here, so
+        # for the same Faker.seed(), count and chunk_size the data is the same on any machine
+        pieces = [_split(size, PARALLEL_TASK_SIZE) for size in sizes]
+        tasks = list(chain.from_iterable(pieces))
+        seeds = [get_fake().random.getrandbits(64) for _ in tasks]
+        workers = os.cpu_count() or 1
+        if workers == 1:
+            yield from _merge_pieces(pieces, map(_generate_seeded_columns, tasks, seeds))
+            return
+
+        # spawn rather than fork: forking after Polars started its thread pool can deadlock
+        spawn = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=workers, mp_context=spawn) as executor:
+            try:
+                results = executor.map(_generate_seeded_columns, tasks, seeds)
+                yield from _merge_pieces(pieces, results)
+            finally:
+                # drop queued tasks if the consumer stops early (write error, break)
+                executor.shutdown(wait=True, cancel_futures=True)
+
+    def _generate_data_in_dict(self, count: int, chunk_size: int = DEFAULT_CHUNK_SIZE) -> list[dict]:
         """Generates a list of dictionaries with fake HR data."""
-        fake_data = []
-        for _ in range(count):
-
-            # choosing a department randomly
-            department = fake.random_element(elements=DEPARTMENT_POSITION_MAPPING.keys())
-            position = fake.random_element(elements=DEPARTMENT_POSITION_MAPPING[department])
-
-            fake_data.append({
-                "first_name": fake.first_name(),
-                "last_name": fake.last_name(),
-                "email": fake.email(),
-                "phone_number": fake.phone_number(),
-                "address": fake.address(),
-                "date_of_birth": fake.date_of_birth(minimum_age=18, maximum_age=65).isoformat(),
-                "department": department,
-                "position": position,
-                "hire_date": fake.date_between(start_date='-10y', end_date='today').isoformat(),
-                "salary": round(fake.random_int(min=35000, max=120000) / 1000) * 1000,
-                "event_type": EventType.HIRE.value,
-            })
-        return fake_data
-
-    def generate(self, count: int = 1000, output_format: OutputFormat = OutputFormat.DICT, output_path: str = "hr_data") -> list[dict] | str:
+        return [
+            dict(zip(columns, row))
+            for columns in self._generate_column_chunks(count, chunk_size)
+            for row in zip(*columns.values())
+        ]
+
+    def _generate_records(self, count: int, chunk_size: int = DEFAULT_CHUNK_SIZE) -> list[HRRecord]:
+        """Generates a list of HRRecord instances with fake HR data."""
+        # columns are picked by field name, so their order in the mapping does not matter
+        names = [field.name for field in fields(HRRecord)]
+        return [
+            HRRecord(*row)
+            for columns in self._generate_column_chunks(count, chunk_size)
+            for row in zip(*(columns[name] for name in names))
+        ]
+
+    def _generate_chunks(self, count: int, chunk_size: int) -> Iterator[pl.DataFrame]:
+        """Generates fake HR data as DataFrames of at most chunk_size rows."""
+        for columns in self._generate_column_chunks(count, chunk_size):
+            yield pl.DataFrame(columns)
+
+    def generate_frame(self, count: int = 1000, chunk_size: int = DEFAULT_CHUNK_SIZE) -> pl.DataFrame:
+        """
+        Generates fake HR data as a Polars DataFrame.
+        Args:
+            count (int): Number of records to generate.
+            chunk_size (int): Number of records generated at once.
+        """
+
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be a positive integer, got {chunk_size}.")
+        return pl.concat(self._generate_chunks(count, chunk_size))
+
+    def generate(
+        self,
+        count: int = 1000,
+        output_format: OutputFormat = OutputFormat.DICT,
+        output_path: str = "hr_data",
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> list[dict] | list[HRRecord] | str:
         """
         Generates fake HR data in desired format.
         Args:
             count (int): Number of records to generate.
             format (OutputFormat): Desired output format.
             output_path (str): Path to save the output file (if applicable).
+            chunk_size (int): Number of records generated and written at once (if applicable).
         """
 
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be a positive integer, got {chunk_size}.")
+
         if output_format == OutputFormat.DICT:
-            return self._generate_data_in_dict(count)
+            return self._generate_data_in_dict(count, chunk_size)
+        elif output_format == OutputFormat.RECORDS:
+            return self._generate_records(count, chunk_size)
         elif output_format == OutputFormat.CSV:
-            data = self._generate_data_in_dict(count)
-            df = pl.DataFrame(data)
-            df.write_csv(f"{output_path}.csv")
+            with open(f"{output_path}.csv", "w", encoding="utf-8") as file:
+                for index, df in enumerate(self._generate_chunks(count, chunk_size)):
+                    df.write_csv(file, include_header=index == 0)
             return f"Data saved to {output_path}.csv"
         elif output_format == OutputFormat.PARQUET:
-            data = self._generate_data_in_dict(count)
-            df = pl.DataFrame(data)
-            df.write_parquet(f"{output_path}.parquet")
+            df = self.generate_frame(count, chunk_size)
+            df.write_parquet(f"{output_path}.parquet", row_group_size=chunk_size)
             return f"Data saved to {output_path}.parquet"
         elif output_format == OutputFormat.JSON:
-            data = self._generate_data_in_dict(count)
-            df = pl.DataFrame(data)
-            df.write_json(f"{output_path}.json")
+            # newline-delimited JSON, so chunks can be appended one after another
+            with open(f"{output_path}.json", "w", encoding="utf-8") as file:
+                for df in self._generate_chunks(count, chunk_size):
+                    df.write_ndjson(file)
             return f"Data saved to {output_path}.json"
         else:
-            raise ValueError("Unsupported format. Choose from DICT, CSV, PARQUET, JSON.")
+            raise ValueError("Unsupported format. Choose from DICT, RECORDS, CSV, PARQUET, JSON.")
+
+
+def _split(count: int, size: int) -> list[int]:
+    """Splits count into pieces of at most size records."""
+    return [min(size, count - start) for start in range(0, count, size)]
+
+
+def _merge_pieces(
+    pieces: list[list[int]], results: Iterator[dict[str, list]]
+) -> Iterator[dict[str, list]]:
+    """Joins the column mappings generated for the pieces of each chunk, in order."""
+    for chunk_pieces in pieces:
+        parts = [next(results) for _ in chunk_pieces]
+        yield {name: list(chain.from_iterable(part[name] for part in parts)) for name in parts[0]}
+
+
+def _generate_seeded_columns(count: int, seed: int) -> dict[str, list]:
+    """
+    Generates columns from a random stream seeded with seed.
+    Entry point of the worker processes; in-process, the shared random stream is restored.
+    """
+    fake = get_fake()
+    shared_random = fake.random
+    fake.random = random.Random(seed)
+    try:
+        return HRDataGenerator()._generate_data_in_columns(count)
+    finally:
+        fake.random = shared_random
 
 
 class Settings(BaseSettings):
@@ -102,6 +285,7 @@ class Settings(BaseSettings):
     count: int = 1000
     output_format: OutputFormat = OutputFormat.DICT
     output_path: str = "hr_data"
+    chunk_size: PositiveInt = DEFAULT_CHUNK_SIZE
 
 
 def main():
@@ -110,7 +294,8 @@ def main():
     result = settings.data_generator.generate(
         count=settings.count,
         output_format=settings.output_format,
-        output_path=settings.output_path
+        output_path=settings.output_path,
+        chunk_size=settings.chunk_size,
     )
     if isinstance(result, str):
         print(result)
@@ -3,11 +3,16 @@ Automated event generator module for HR data.
 """
 
 from datetime import date
+from fractions import Fraction
+from pathlib import Path
 import random
-from faker import Faker
 import polars as pl
-from base_data_generator import HRDataGenerator, OutputFormat, EventType
-from hr.mapping import DEPARTMENT_POSITION_MAPPING
+from base_data_generator import HRDataGenerator, OutputFormat, EventType, get_fake
+from hr.mapping import DEPARTMENT_POSITIONS, DEPARTMENTS
+
+
+_EVENT_TYPES = tuple(EventType)
+_HR_GENERATOR = HRDataGenerator()
 
 
 def get_data(record_count: int = 1) -> list[dict]:
@@ -20,29 +25,80 @@ def get_data(record_count: int = 1) -> list[dict]:
     TODO: Add support for real world scenarios.
     """
 
-    generator = HRDataGenerator()
-    return generator.generate(count=record_count, output_format=OutputFormat.DICT)
+    return _HR_GENERATOR.generate(count=record_count, output_format=OutputFormat.DICT)
+
+
+def _get_data_frame(record_count: int = 1) -> pl.DataFrame:
+    """
+    Generates initial HR data as a DataFrame.
+    """
+
+    return _HR_GENERATOR.generate_frame(count=record_count)
 
 
-def get_data_from_csv(path: str) -> list[dict]:
+def get_data_from_csv(path: str, sample_size: int | None = None) -> list[dict]:
     """
     Get initial data from a csv.
+    :param path: Path of the csv file.
+    :param sample_size: Count of records to sample randomly, all records if None.
+    """
+
+    return _read_csv(path, sample_size).to_dicts()
+
+
+def get_data_from_json(path: str, sample_size: int | None = None) -> list[dict]:
+    """
+    Get initial data from a newline-delimited json.
+    :param path: Path of the json file.
+    :param sample_size: Count of records to sample randomly, all records if None.
+    """
+
+    return _read_json(path, sample_size).to_dicts()
+
+
+def _read_csv(path: str, sample_size: int | None = None) -> pl.DataFrame:
+    """
+    Read (a random sample of) a csv into a DataFrame.
     """
 
-    data = pl.read_csv(path)
-    return data.to_dicts()
+    return _sample(pl.scan_csv(path).collect(engine="streaming"), sample_size)
 
 
-def get_data_from_json(path: str) -> list[dict]:
+def _read_json(path: str, sample_size: int | None = None) -> pl.DataFrame:
     """
-    Get initial data from a json.
+    Read (a random sample of) a newline-delimited json into a DataFrame.
     """
 
-    data = pl.read_json(path)
-    return data.to_dicts()
+    return _sample(pl.scan_ndjson(path).collect(engine="streaming"), sample_size)
 
 
-def generate_event(record_count: int = 1, path: str = None, sample_size: int = 50):
+def _sample(data: pl.DataFrame, sample_size: int | None) -> pl.DataFrame:
+    """
+    Randomly sample rows of the DataFrame, or return it unchanged if sample_size is None.
+    """
+
+    if sample_size is None:
+        return data
+    return data.sample(n=sample_size, seed=random.getrandbits(32))
+
+
+_READERS = {
+    ".csv": _read_csv,
+    ".json": _read_json,
+}
+
+
+def _raised_salary(factor: Fraction) -> pl.Expr:
+    """
+    Salary raised by factor, rounded half up to thousands.
+    The arithmetic runs in integers on the whole salary column.
+    """
+
+    numerator, denominator = factor.numerator, factor.denominator
+    return (pl.col("salary") * numerator + denominator * 500) // (denominator * 1000) * 1000
+
+
+def generate_event(record_count: int = 1, path: str = None, sample_size: int = 50) -> list[dict]:
     """
     Automated events for HR data.
     :param record_count: Number of records to generate.
@@ -51,59 +107,55 @@ def generate_event(record_count: int = 1, path: str = None, sample_size: int = 5
     :return: List of dictionaries containing HR event data.
     """
 
-    fake = Faker()
-    event_type = fake.random_element(elements=list(EventType))
-    if ".csv" in path:
-        input_data = random.sample(get_data_from_csv(path=path), sample_size)
-    elif ".json" in path:
-        input_data = random.sample(get_data_from_json(path=path), sample_size)
-    else:
-        input_data = random.sample(get_data(record_count), sample_size)
+    return generate_event_frame(record_count, path, sample_size).to_dicts()
 
+
+def generate_event_frame(record_count: int = 1, path: str = None, sample_size: int = 50) -> pl.DataFrame:
+    """
+    Automated events for HR data, as a DataFrame.
+    Parameters are the same as for generate_event; records stay in Polars throughout.
+    """
+
+    fake = get_fake()
+    event_type = fake.random.choice(_EVENT_TYPES)
+    event_columns = [
+        pl.lit(event_type.value).alias("event_type"),
+        pl.lit(date.today().isoformat()).alias("event_date"),
+    ]
+
+    # a hire introduces a new employee, so no initial data is needed
     if event_type == EventType.HIRE:
-        new_employee = HRDataGenerator().generate(
-            count=1, output_format=OutputFormat.DICT
-        )[0]
-        new_employee["event_type"] = EventType.HIRE.value
-        new_employee["hire_date"] = date.today().isoformat()
-        return [new_employee]
-    elif event_type == EventType.RESIGNATION:
-        for record in input_data:
-            record["event_type"] = EventType.RESIGNATION.value
-            record["event_date"] = date.today().isoformat()
-        return input_data
+        return _get_data_frame().with_columns(
+            event_columns[0], event_columns[1].alias("hire_date")
+        )
+
+    reader = _READERS.get(Path(path).suffix) if path else None
+    if reader is not None:
+        input_data = reader(path=path, sample_size=sample_size)
+    else:
+        input_data = _sample(_get_data_frame(record_count), sample_size)
+
+    if event_type == EventType.RESIGNATION:
+        return input_data.with_columns(event_columns)
     elif event_type == EventType.PROMOTION:
-        for record in input_data:
-            record["event_type"] = EventType.PROMOTION.value
-            record["salary"] = round(record["salary"] * 1.2 / 1000) * 1000
-            record["event_date"] = date.today().isoformat()
-        return input_data
+        return input_data.with_columns(_raised_salary(Fraction("1.2")), *event_columns)
     elif event_type == EventType.SALARY_INCREASE:
-        for record in input_data:
-            record["event_type"] = EventType.SALARY_INCREASE.value
-            record["salary"] = round(record["salary"] * 1.1 / 1000) * 1000
-            record["event_date"] = date.today().isoformat()
-        return input_data
+        return input_data.with_columns(_raised_salary(Fraction("1.1")), *event_columns)
     elif event_type == EventType.DEPARTMENT_CHANGE:
-        for record in input_data:
-            new_department = fake.random_element(
-                elements=list(DEPARTMENT_POSITION_MAPPING.keys())
-            )
-            new_position = fake.random_element(
-                elements=DEPARTMENT_POSITION_MAPPING[new_department]
-            )
-            record["event_type"] = EventType.DEPARTMENT_CHANGE.value
-            record["department"] = new_department
-            record["position"] = new_position
-            record["salary"] = (
-                round(fake.random_int(min=35000, max=120000) / 1000) * 1000
-            )
-            record["event_date"] = date.today().isoformat()
-        return input_data
-
-    return []  # Fallback, should not reach here
+        rng = fake.random
+        new_departments = rng.choices(DEPARTMENTS, k=input_data.height)
+        new_positions = [rng.choice(DEPARTMENT_POSITIONS[department]) for department in new_departments]
+        new_salaries = [thousands * 1000 for thousands in rng.choices(range(35, 121), k=input_data.height)]
+        return input_data.with_columns(
+            event_columns[0],
+            pl.Series("department", new_departments, dtype=pl.String),
+            pl.Series("position", new_positions, dtype=pl.String),
+            pl.Series("salary", new_salaries, dtype=pl.Int64),
+            event_columns[1],
+        )
+
+    return input_data.clear()  # Fallback, should not reach here
 
 
 if __name__ == "__main__":
-    event_data = generate_event(50, "hr_data.json", 500)
-    pl.from_dicts(event_data).write_json("event_data.json")
+    generate_event_frame(50, "hr_data.json", 500).write_ndjson("event_data.json")
@@ -110,4 +110,11 @@ DEPARTMENT_POSITION_MAPPING = {
         "Biotechnologist",
         "Chemical Engineer",
     ],
-}
\ No newline at end of file
+}
+
+# Immutable views of the mapping for fast random selection in hot loops.
+DEPARTMENTS = tuple(DEPARTMENT_POSITION_MAPPING)
+DEPARTMENT_POSITIONS = {
+    department: tuple(positions)
+    for department, positions in DEPARTMENT_POSITION_MAPPING.items()
+}